@@ -1,26 +1,68 @@
 from __future__ import annotations
 
-import io
-import json
+import asyncio
+import hashlib
+import multiprocessing
+import os
 import re
-from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+from dataclasses import astuple, dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
 from fastapi import FastAPI, Request, Form
-from fastapi.responses import HTMLResponse, StreamingResponse, JSONResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
+import orjson
+from starlette.concurrency import run_in_threadpool
 
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.units import inch
+from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfgen import canvas
 
 
-app = FastAPI()
+# ReportLab rendering is CPU-bound and holds the GIL, so it runs in worker processes.
+# Each uvicorn worker gets its own pool; keep it small on memory-tight hosts.
+PDF_WORKERS = max(1, int(os.environ.get("PDF_WORKERS", "1")))
+PDF_POOL: Optional[ProcessPoolExecutor] = None
+
+
+def _new_pdf_pool() -> ProcessPoolExecutor:
+    # spawn, not fork: the uvicorn worker already has threads running
+    return ProcessPoolExecutor(max_workers=PDF_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global PDF_POOL
+    PDF_POOL = _new_pdf_pool()
+    try:
+        yield
+    finally:
+        PDF_POOL.shutdown(cancel_futures=True)
+        PDF_POOL = None
+
+
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
 app.mount("/static", StaticFiles(directory="static"), name="static")
-templates = Jinja2Templates(directory="templates")
+# Templates don't change at runtime: skip the per-render mtime check and reuse compiled bytecode across restarts.
+templates = Jinja2Templates(
+    env=Environment(
+        loader=FileSystemLoader("templates"),
+        autoescape=True,
+        auto_reload=False,
+        bytecode_cache=FileSystemBytecodeCache(),
+    )
+)
 
 TEMPLATES = ["classic", "modern", "compact", "executive", "minimal", "bold"]
+TEMPLATE_SET = frozenset(TEMPLATES)
 
 FONT_MAP = {
     "sans": ("Helvetica", "Helvetica-Bold"),
@@ -29,16 +71,44 @@ FONT_MAP = {
 }
 
 
-@dataclass
+def _glyph_width(ch: str, font_name: str) -> int:
+    # width in 1/1000 em; summing ints and scaling once matches stringWidth exactly
+    return round(pdfmetrics.stringWidth(ch, font_name, 1000))
+
+
+# Printable ASCII plus the glyphs the app emits itself ("•", "—", "’") are resolved up front.
+FONT_WIDTHS: Dict[str, Dict[str, int]] = {
+    font: {ch: _glyph_width(ch, font) for ch in [*map(chr, range(32, 127)), "•", "—", "’"]}
+    for pair in FONT_MAP.values()
+    for font in pair
+}
+# Other characters come from user text, so their widths go through a bounded cache rather than into FONT_WIDTHS.
+_other_glyph_width = lru_cache(maxsize=4096)(_glyph_width)
+
+# Compiled once at import so requests skip the loader lookup and re-parse.
+PAGE_TEMPLATES = {
+    name: templates.get_template(name)
+    for name in ("index.html", "templates_page.html", "guided_page.html", "cover_page.html", "result.html", "cover_result.html")
+}
+RESULT_TEMPLATES = {t: templates.get_template(f"result_{t}.html") for t in TEMPLATES}
+
+# Repeat downloads of an unchanged resume reuse the last bytes (PDFs are ~2-3 KB).
+# Keyed by a digest of the form so the form text itself isn't kept around.
+# Only touched from the event loop, so no locking is needed.
+PDF_CACHE: OrderedDict[bytes, bytes] = OrderedDict()
+PDF_CACHE_SIZE = 32
+
+
+@dataclass(frozen=True, slots=True)
 class Job:
     title: str = ""
     company: str = ""
     location: str = ""
     dates: str = ""
-    bullets: List[str] = field(default_factory=list)
+    bullets: Tuple[str, ...] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class ResumeData:
     full_name: str = ""
     email: str = ""
@@ -57,11 +127,11 @@ class ResumeData:
     font_family: str = "sans"
     page_limit: int = 1
 
-    jobs: List[Job] = field(default_factory=list)
+    jobs: Tuple[Job, ...] = ()
     jobs_json: str = "[]"
 
 
-@dataclass
+@dataclass(slots=True)
 class CoverLetterData:
     full_name: str = ""
     email: str = ""
@@ -88,34 +158,63 @@ ACTION_VERBS = [
     "Optimized", "Supported", "Resolved", "Launched", "Standardized"
 ]
 
+ACTION_VERB_RE = re.compile(r"^(" + "|".join(v.lower() for v in ACTION_VERBS) + r")\b", re.I)
+
+BULLET_SPLIT_RE = re.compile(r"[•\n;]+")
+LEAD_DASH_RE = re.compile(r"^\-+\s*")
+FILLER_RE = re.compile(r"^(i\s+)?(was\s+)?(did\s+)?", re.I)
+LEAD_WORD_RE = re.compile(r"^\w+\s")
+TRAILING_DOT_RE = re.compile(r"\.$")
+FILLER_WORDS_RE = re.compile(r"\b(?:very|really)\b", re.I)
+
+# Forms larger than this (total characters across the view inputs) are not cached.
+VIEW_CACHE_MAX_CHARS = 16 * 1024
+
+DEFAULT_SKILLS = ("Leadership", "Coaching", "Process Improvement", "Communication")
+
+# cover letter tone presets (kept simple and non-cringe)
+TONE_OPEN = {
+    "confident": "I’m excited to apply",
+    "warm": "I’d love to be considered",
+    "direct": "I’m applying",
+    "executive": "I’m writing to express interest",
+}
+
+TONE_VOICE = {
+    "confident": "I bring steady leadership, strong follow-through, and a bias for action.",
+    "warm": "I care about people, communication, and doing the work the right way.",
+    "direct": "I deliver results, keep teams aligned, and move work forward fast.",
+    "executive": "I align teams to priorities, simplify execution, and deliver measurable outcomes.",
+}
+
 
 # ----------------------------
 # Helpers
 # ----------------------------
 def _clean(s: str) -> str:
-    s = (s or "").strip()
-    s = re.sub(r"\s+", " ", s)
-    return s
+    return " ".join((s or "").split())
 
 
 def _title_name(name: str) -> str:
     name = _clean(name)
     if not name:
         return ""
+    # str.title() capitalizes after apostrophes, hyphens and digits too, so only use it for plain names
+    if name.isascii() and name.replace(" ", "").isalpha():
+        return name.title()
     return " ".join([w[:1].upper() + w[1:].lower() if w else "" for w in name.split()])
 
 
 def _split_csv(s: str) -> List[str]:
-    s = _clean(s)
+    # callers pass _clean()ed text, so stripping each part is enough
     if not s:
         return []
-    parts = [p.strip() for p in s.split(",")]
-    return [p for p in parts if p]
+    return [p for p in (x.strip() for x in s.split(",")) if p]
 
 
 def _clamp_template(t: str) -> str:
     t = (t or "").strip().lower()
-    return t if t in TEMPLATES else "classic"
+    return t if t in TEMPLATE_SET else "classic"
 
 
 def _clamp_font(f: str) -> str:
@@ -145,52 +244,53 @@ def _make_bullets(text: str, max_items: int = 6) -> List[str]:
     if not text:
         return []
 
-    chunks = re.split(r"[•\n;]+", text)
     expanded: List[str] = []
-    for c in chunks:
+    for c in BULLET_SPLIT_RE.split(text):
         c = c.strip()
         if not c:
             continue
         if "," in c and len(c) > 50:
-            expanded.extend([x.strip() for x in c.split(",") if x.strip()])
+            expanded.extend([x for x in (p.strip() for p in c.split(",")) if x])
         else:
             expanded.append(c)
 
     bullets: List[str] = []
     for i, raw in enumerate(expanded):
-        txt = re.sub(r"^\-+\s*", "", raw).strip()
-        txt = re.sub(r"^(i\s+)?(was\s+)?(did\s+)?", "", txt, flags=re.I).strip()
+        txt = LEAD_DASH_RE.sub("", raw).strip()
+        txt = FILLER_RE.sub("", txt).strip()
         txt = _sentenceize(txt)
         if not txt:
             continue
         verb = ACTION_VERBS[i % len(ACTION_VERBS)]
-        if re.match(r"^(led|managed|coached|improved|streamlined|built|owned|delivered|reduced|increased|trained|implemented|coordinated|optimized|supported|resolved|launched|standardized)\b", txt, re.I):
+        if ACTION_VERB_RE.match(txt):
             bullets.append(txt)
         else:
             bullets.append(f"{verb} {txt[0].lower() + txt[1:]}")
     return bullets[:max_items]
 
 
-def _normalize_skills(skills: str, strengths: str) -> List[str]:
-    items = _split_csv(skills) or _split_csv(strengths)
+def _normalize_skills(items: List[str]) -> List[str]:
     out: List[str] = []
+    seen = set()
     for it in items:
         it = it.strip()
         if not it:
             continue
         clean = it if it.isupper() else it[:1].upper() + it[1:]
-        if clean.lower() not in [x.lower() for x in out]:
+        key = clean.lower()
+        if key not in seen:
+            seen.add(key)
             out.append(clean)
     return out[:18]
 
 
 def _parse_jobs_json(jobs_json: str) -> List[Job]:
     jobs_json = (jobs_json or "").strip()
-    if not jobs_json:
+    if not jobs_json or jobs_json == "[]":
         return []
     try:
-        raw = json.loads(jobs_json)
-    except Exception:
+        raw = orjson.loads(jobs_json)
+    except orjson.JSONDecodeError:
         return []
     if not isinstance(raw, list):
         return []
@@ -202,7 +302,7 @@ def _parse_jobs_json(jobs_json: str) -> List[Job]:
         if isinstance(bullets, str):
             bullets_list = _make_bullets(bullets, max_items=6)
         elif isinstance(bullets, list):
-            bullets_list = [_sentenceize(str(b)) for b in bullets if str(b).strip()]
+            bullets_list = [_sentenceize(b) for b in map(str, bullets) if b.strip()]
         else:
             bullets_list = []
         jobs.append(
@@ -211,25 +311,32 @@ def _parse_jobs_json(jobs_json: str) -> List[Job]:
                 company=_clean(str(item.get("company", ""))),
                 location=_clean(str(item.get("location", ""))),
                 dates=_clean(str(item.get("dates", ""))),
-                bullets=bullets_list[:6],
+                bullets=tuple(bullets_list[:6]),
             )
         )
     return jobs
 
 
-def _generate_resume_summary(data: ResumeData, highlights: List[str], skills_list: List[str]) -> str:
-    if _clean(data.summary):
-        return _sentenceize(data.summary)
+def _generate_resume_summary(
+    summary: str,
+    years_experience: str,
+    target_title: str,
+    strengths_list: List[str],
+    highlights: Tuple[str, ...],
+    skills_list: Tuple[str, ...],
+) -> str:
+    if _clean(summary):
+        return _sentenceize(summary)
 
-    years = _clean(data.years_experience) or "several"
-    title = _clean(data.target_title) or "leader"
+    years = _clean(years_experience) or "several"
+    title = _clean(target_title) or "leader"
 
-    core = _split_csv(data.strengths)[:5]
+    core = strengths_list[:5]
     core_str = ", ".join(core) if core else "operations, team leadership, and problem solving"
 
     line1 = f"{years}+ years as a {title}, focused on {core_str}."
     if highlights:
-        h = re.sub(r"\.$", "", highlights[0])
+        h = TRAILING_DOT_RE.sub("", highlights[0])
         line2 = f"Known for results like: {h}."
     else:
         line2 = "Known for clear communication, steady leadership, and practical execution."
@@ -242,6 +349,35 @@ def _generate_resume_summary(data: ResumeData, highlights: List[str], skills_lis
     return " ".join([line1, line2, line3])
 
 
+def _build_view(
+    wins: str,
+    strengths: str,
+    skills: str,
+    summary: str,
+    years_experience: str,
+    target_title: str,
+    jobs_json: str,
+) -> Tuple[Tuple[Job, ...], Tuple[str, ...], Tuple[str, ...], str]:
+    # Cached results are shared, so everything returned is immutable.
+    jobs = tuple(_parse_jobs_json(jobs_json))
+    highlights = tuple(_make_bullets(wins, max_items=7))
+    # strengths feed both the skills fallback and the summary; split them once
+    strengths_list = _split_csv(strengths)
+    skills_list = tuple(_normalize_skills(_split_csv(skills) or strengths_list))
+    polished_summary = _generate_resume_summary(summary, years_experience, target_title, strengths_list, highlights, skills_list)
+    return jobs, highlights, skills_list, polished_summary
+
+
+_cached_view = lru_cache(maxsize=512)(_build_view)
+
+
+def _compute_view(*fields: str) -> Tuple[Tuple[Job, ...], Tuple[str, ...], Tuple[str, ...], str]:
+    # Live preview re-sends mostly identical forms. Oversized ones skip the cache so their text isn't kept after the request.
+    if sum(map(len, fields)) > VIEW_CACHE_MAX_CHARS:
+        return _build_view(*fields)
+    return _cached_view(*fields)
+
+
 # ----------------------------
 # Mini polish endpoints
 # ----------------------------
@@ -249,28 +385,27 @@ def _polish_resume(payload: Dict[str, Any]) -> Dict[str, Any]:
     summary = _clean(str(payload.get("summary", "")))
     wins = _clean(str(payload.get("wins", "")))
     strengths = _clean(str(payload.get("strengths", "")))
+    skills = _clean(str(payload.get("skills", "")))
     title = _clean(str(payload.get("target_title", ""))) or "leader"
     years = _clean(str(payload.get("years_experience", ""))) or "10+"
 
     bullets = _make_bullets(wins, max_items=7)
+    strengths_list = _split_csv(strengths)
 
     if summary:
         s = _sentenceize(summary)
-        s = re.sub(r"\bvery\b", "", s, flags=re.I)
-        s = re.sub(r"\breally\b", "", s, flags=re.I)
-        s = re.sub(r"\s{2,}", " ", s).strip()
-        polished_summary = s
+        polished_summary = " ".join(FILLER_WORDS_RE.sub("", s).split())
     else:
-        core = _split_csv(strengths)[:5]
+        core = strengths_list[:5]
         core_str = ", ".join(core) if core else "operations, people leadership, and problem solving"
         polished_summary = (
             f"{years}+ years as a {title}, known for {core_str}. "
             f"Delivers consistent results through clear direction, calm execution, and strong follow-through."
         )
 
-    skill_suggestions = _normalize_skills(payload.get("skills", ""), strengths)
+    skill_suggestions = _normalize_skills(_split_csv(skills) or strengths_list)
     if not skill_suggestions:
-        skill_suggestions = _normalize_skills("", "Leadership, Coaching, Process Improvement, Communication")
+        skill_suggestions = list(DEFAULT_SKILLS)
 
     return {
         "polished_summary": polished_summary,
@@ -290,20 +425,8 @@ def _polish_cover(payload: Dict[str, Any]) -> Dict[str, Any]:
     why_company = _clean(str(payload.get("why_company", "")))
     closing_note = _clean(str(payload.get("closing_note", "")))
 
-    # tone presets (kept simple and non-cringe)
-    tone_open = {
-        "confident": "I’m excited to apply",
-        "warm": "I’d love to be considered",
-        "direct": "I’m applying",
-        "executive": "I’m writing to express interest",
-    }.get(tone, "I’m excited to apply")
-
-    tone_voice = {
-        "confident": "I bring steady leadership, strong follow-through, and a bias for action.",
-        "warm": "I care about people, communication, and doing the work the right way.",
-        "direct": "I deliver results, keep teams aligned, and move work forward fast.",
-        "executive": "I align teams to priorities, simplify execution, and deliver measurable outcomes.",
-    }.get(tone, "I bring steady leadership, strong follow-through, and a bias for action.")
+    tone_open = TONE_OPEN.get(tone, TONE_OPEN["confident"])
+    tone_voice = TONE_VOICE.get(tone, TONE_VOICE["confident"])
 
     mgr_line = f"{manager}," if manager else "Hiring Manager,"
     company_line = company if company else "your team"
@@ -313,7 +436,7 @@ def _polish_cover(payload: Dict[str, Any]) -> Dict[str, Any]:
     ach_bullets = _make_bullets(achievements, max_items=3)
     ach_sentence = ""
     if ach_bullets:
-        ach_sentence = " ".join([re.sub(r"^\w+\s", "", b).strip() for b in ach_bullets])
+        ach_sentence = " ".join([LEAD_WORD_RE.sub("", b).strip() for b in ach_bullets])
         ach_sentence = _sentenceize(ach_sentence)
 
     core_strengths = _split_csv(strengths)[:6]
@@ -353,31 +476,81 @@ def _polish_cover(payload: Dict[str, Any]) -> Dict[str, Any]:
 # ----------------------------
 # PDF helpers
 # ----------------------------
+def _text_width(s: str, font_name: str) -> int:
+    widths = FONT_WIDTHS[font_name]
+    try:
+        return sum(map(widths.__getitem__, s))
+    except KeyError:
+        get = widths.get
+        return sum(w if (w := get(ch)) is not None else _other_glyph_width(ch, font_name) for ch in s)
+
+
+def _width_budget(maxw: float, font_size: float) -> int:
+    # largest glyph-unit total n with n * 0.001 * font_size <= maxw, i.e. the exact stringWidth test
+    n = int(maxw / (0.001 * font_size)) + 1
+    while n * 0.001 * font_size > maxw:
+        n -= 1
+    return n
+
+
+def _wrap_lines(words: List[str], font_name: str, font_size: float, maxw: float) -> List[str]:
+    limit = _width_budget(maxw, font_size)
+    space_w = FONT_WIDTHS[font_name][" "]
+    lines: List[str] = []
+    cur_words: List[str] = []
+    cur_w = 0
+    for w in words:
+        if not w:
+            continue
+        ww = _text_width(w, font_name)
+        test_w = cur_w + space_w + ww if cur_words else ww
+        if test_w <= limit:
+            cur_words.append(w)
+            cur_w = test_w
+        else:
+            lines.append(" ".join(cur_words))
+            cur_words = [w]
+            cur_w = ww
+    if cur_words:
+        lines.append(" ".join(cur_words))
+    return lines
+
+
 def _pdf_wrap(c: canvas.Canvas, text: str, x: float, y: float, maxw: float, font_name: str, font_size: int, leading: float) -> float:
     text = (text or "").rstrip()
     if not text:
         return y
-    c.setFont(font_name, font_size)
+    c.setFont(font_name, font_size, leading)
+    # one BT/ET block for the whole text; each textLine advances by the leading
+    tx = c.beginText(x, y)
 
     # preserve paragraphs
     paragraphs = text.split("\n")
     for p in paragraphs:
         if p.strip() == "":
+            tx.textLine()
             y -= leading
             continue
-        words = p.split(" ")
-        line = ""
-        for w in words:
-            test = (line + " " + w).strip()
-            if c.stringWidth(test, font_name, font_size) <= maxw:
-                line = test
-            else:
-                c.drawString(x, y, line)
-                y -= leading
-                line = w
-        if line:
-            c.drawString(x, y, line)
+        for line in _wrap_lines(p.split(" "), font_name, font_size, maxw):
+            tx.textLine(line)
             y -= leading
+    c.drawText(tx)
+    return y
+
+
+def _pdf_bullets(c: canvas.Canvas, bullets: Tuple[str, ...], x: float, y: float, maxw: float, font_name: str, font_size: float, leading: float, bottom: float) -> float:
+    if not bullets or y < bottom:
+        return y
+    c.setFont(font_name, font_size, leading)
+    # all bullets share one text object; stop starting new ones once past the bottom margin
+    tx = c.beginText(x, y)
+    for b in bullets:
+        if y < bottom:
+            break
+        for line in _wrap_lines(f"• {b}".split(" "), font_name, font_size, maxw):
+            tx.textLine(line)
+            y -= leading
+    c.drawText(tx)
     return y
 
 
@@ -391,17 +564,17 @@ def _pdf_section_title(c: canvas.Canvas, title: str, x: float, y: float, maxw: f
     return y
 
 
-def _build_resume_pdf_bytes(data: ResumeData, polished_summary: str, highlights: List[str], skills_list: List[str]) -> bytes:
-    buf = io.BytesIO()
-    c = canvas.Canvas(buf, pagesize=letter)
+def _build_resume_pdf_bytes(data: ResumeData, polished_summary: str, highlights: Tuple[str, ...], skills_list: Tuple[str, ...]) -> bytes:
+    c = canvas.Canvas(None, pagesize=letter)
     width, height = letter
 
-    font_name, font_bold = FONT_MAP.get(data.font_family, FONT_MAP["sans"])
+    font_name, font_bold = FONT_MAP[data.font_family]
 
     left = 0.85 * inch
     right = width - 0.85 * inch
     top = height - 0.85 * inch
     maxw = right - left
+    bottom = 1.25 * inch
 
     c.setFont(font_bold, 18)
     c.drawString(left, top, data.full_name or "Your Name")
@@ -444,30 +617,21 @@ def _build_resume_pdf_bytes(data: ResumeData, polished_summary: str, highlights:
         right_col = skills[mid:]
 
         yy = y
-        for s in left_col:
-            if yy < 1.25 * inch:
+        n_right = len(right_col)
+        # left_col is never shorter than right_col, so rows follow it
+        for i, s in enumerate(left_col):
+            if yy < bottom:
                 if data.page_limit == 1:
                     break
                 c.showPage()
-                y = height - 0.85 * inch
-                yy = y
+                yy = top
                 c.setFont(font_name, 10.5)
             c.drawString(x1, yy, f"• {s}")
+            if i < n_right:
+                c.drawString(x2, yy, f"• {right_col[i]}")
             yy -= 13
 
-        yy2 = y
-        for s in right_col:
-            if yy2 < 1.25 * inch:
-                if data.page_limit == 1:
-                    break
-                c.showPage()
-                y = height - 0.85 * inch
-                yy2 = y
-                c.setFont(font_name, 10.5)
-            c.drawString(x2, yy2, f"• {s}")
-            yy2 -= 13
-
-        y = min(yy, yy2) - 6
+        y = yy - 6
 
     if data.jobs:
         y = _pdf_section_title(c, "Experience", left, y, maxw, font_bold)
@@ -476,8 +640,7 @@ def _build_resume_pdf_bytes(data: ResumeData, polished_summary: str, highlights:
                 if data.page_limit == 1:
                     break
                 c.showPage()
-                y = height - 0.85 * inch
-                y = _pdf_section_title(c, "Experience", left, y, maxw, font_bold)
+                y = _pdf_section_title(c, "Experience", left, top, maxw, font_bold)
 
             header_left = " — ".join([p for p in [job.title, job.company] if p])
             header_right = job.dates or ""
@@ -493,10 +656,7 @@ def _build_resume_pdf_bytes(data: ResumeData, polished_summary: str, highlights:
                 c.drawString(left, y, job.location[:90])
                 y -= 12
 
-            for b in job.bullets[:5]:
-                if y < 1.25 * inch:
-                    break
-                y = _pdf_wrap(c, f"• {b}", left, y, maxw, font_name, 10.5, 13)
+            y = _pdf_bullets(c, job.bullets[:5], left, y, maxw, font_name, 10.5, 13, bottom)
             y -= 6
 
     footer_blocks: List[str] = []
@@ -510,7 +670,7 @@ def _build_resume_pdf_bytes(data: ResumeData, polished_summary: str, highlights:
     if footer_blocks:
         if y < 1.35 * inch and data.page_limit == 2:
             c.showPage()
-            y = height - 0.85 * inch
+            y = top
         if y >= 1.10 * inch:
             y = _pdf_section_title(c, "Additional", left, y, maxw, font_bold)
             for block in footer_blocks:
@@ -519,16 +679,14 @@ def _build_resume_pdf_bytes(data: ResumeData, polished_summary: str, highlights:
                 y = _pdf_wrap(c, block, left, y, maxw, font_name, 10.5, 13)
 
     c.showPage()
-    c.save()
-    return buf.getvalue()
+    return c.getpdfdata()
 
 
 def _build_cover_pdf_bytes(data: CoverLetterData, letter_text: str) -> bytes:
-    buf = io.BytesIO()
-    c = canvas.Canvas(buf, pagesize=letter)
+    c = canvas.Canvas(None, pagesize=letter)
     width, height = letter
 
-    font_name, font_bold = FONT_MAP.get(data.font_family, FONT_MAP["sans"])
+    font_name, font_bold = FONT_MAP[data.font_family]
 
     left = 0.9 * inch
     right = width - 0.9 * inch
@@ -568,8 +726,28 @@ def _build_cover_pdf_bytes(data: CoverLetterData, letter_text: str) -> bytes:
         pass
 
     c.showPage()
-    c.save()
-    return buf.getvalue()
+    return c.getpdfdata()
+
+
+# ----------------------------
+# Response helpers
+# ----------------------------
+async def _run_pdf(build: Callable[..., bytes], *args: Any) -> bytes:
+    global PDF_POOL
+    loop = asyncio.get_running_loop()
+    pool = PDF_POOL
+    try:
+        return await loop.run_in_executor(pool, build, *args)
+    except BrokenProcessPool:
+        # a worker died (e.g. OOM-killed) and the pool can't recover: replace it and retry once
+        if PDF_POOL is pool:
+            PDF_POOL = _new_pdf_pool()
+            pool.shutdown(wait=False)
+        return await loop.run_in_executor(PDF_POOL, build, *args)
+
+
+def _render(tmpl: Template, context: Dict[str, Any]) -> HTMLResponse:
+    return HTMLResponse(tmpl.render(context))
 
 
 # ----------------------------
@@ -577,32 +755,32 @@ def _build_cover_pdf_bytes(data: CoverLetterData, letter_text: str) -> bytes:
 # ----------------------------
 @app.get("/", response_class=HTMLResponse)
 def page_builder(request: Request):
-    return templates.TemplateResponse(
-        "index.html",
+    return _render(
+        PAGE_TEMPLATES["index.html"],
         {"request": request, "active_tab": "builder", "templates": TEMPLATES, "selected_template": "classic"},
     )
 
 
 @app.get("/templates", response_class=HTMLResponse)
 def page_templates(request: Request):
-    return templates.TemplateResponse(
-        "templates_page.html",
+    return _render(
+        PAGE_TEMPLATES["templates_page.html"],
         {"request": request, "active_tab": "templates", "templates": TEMPLATES},
     )
 
 
 @app.get("/guided", response_class=HTMLResponse)
 def page_guided(request: Request):
-    return templates.TemplateResponse(
-        "guided_page.html",
+    return _render(
+        PAGE_TEMPLATES["guided_page.html"],
         {"request": request, "active_tab": "guided", "templates": TEMPLATES, "selected_template": "classic"},
     )
 
 
 @app.get("/cover", response_class=HTMLResponse)
 def page_cover(request: Request):
-    return templates.TemplateResponse(
-        "cover_page.html",
+    return _render(
+        PAGE_TEMPLATES["cover_page.html"],
         {"request": request, "active_tab": "cover"},
     )
 
@@ -612,78 +790,67 @@ def page_cover(request: Request):
 # ----------------------------
 @app.post("/polish")
 async def polish(request: Request):
-    payload = await request.json()
+    raw = await request.body()
+    payload = orjson.loads(raw) if raw else {}
     out = _polish_resume(payload if isinstance(payload, dict) else {})
-    return JSONResponse(out)
+    return ORJSONResponse(out)
 
 
 @app.post("/polish_cover")
 async def polish_cover(request: Request):
-    payload = await request.json()
+    raw = await request.body()
+    payload = orjson.loads(raw) if raw else {}
     out = _polish_cover(payload if isinstance(payload, dict) else {})
-    return JSONResponse(out)
+    return ORJSONResponse(out)
 
 
 # ----------------------------
 # Build -> Preview (Resume)
 # ----------------------------
-@app.post("/build", response_class=HTMLResponse)
-def build(
-    request: Request,
-    full_name: str = Form(""),
-    email: str = Form(""),
-    phone: str = Form(""),
-    template: str = Form("classic"),
-    font_family: str = Form("sans"),
-    page_limit: int = Form(1),
-
-    target_title: str = Form(""),
-    years_experience: str = Form(""),
-    strengths: str = Form(""),
-    wins: str = Form(""),
-    summary: str = Form(""),
-    skills: str = Form(""),
-
-    certs: str = Form(""),
-    awards: str = Form(""),
-    include_references: str = Form(""),
+def _materialize(fields: Mapping[str, Any]) -> Tuple[ResumeData, Tuple[str, ...], Tuple[str, ...], str]:
+    def get(name: str) -> str:
+        v = fields.get(name, "")
+        return v if isinstance(v, str) else ""
 
-    jobs_json: str = Form("[]"),
-):
+    include_references = get("include_references")
     data = ResumeData(
-        full_name=_title_name(full_name),
-        email=_clean(email),
-        phone=_clean(phone),
-        template=_clamp_template(template),
-        font_family=_clamp_font(font_family),
-        page_limit=_clamp_page_limit(page_limit),
-
-        target_title=_clean(target_title),
-        years_experience=_clean(years_experience),
-        strengths=_clean(strengths),
-        wins=_clean(wins),
-        summary=_clean(summary),
-        skills=_clean(skills),
-
-        certs=_clean(certs),
-        awards=_clean(awards),
+        full_name=_title_name(get("full_name")),
+        email=_clean(get("email")),
+        phone=_clean(get("phone")),
+        template=_clamp_template(get("template")),
+        font_family=_clamp_font(get("font_family")),
+        page_limit=_clamp_page_limit(get("page_limit")),
+
+        target_title=_clean(get("target_title")),
+        years_experience=_clean(get("years_experience")),
+        strengths=_clean(get("strengths")),
+        wins=_clean(get("wins")),
+        summary=_clean(get("summary")),
+        skills=_clean(get("skills")),
+
+        certs=_clean(get("certs")),
+        awards=_clean(get("awards")),
         include_references=(include_references.strip().lower() == "on") if include_references else False,
 
-        jobs_json=(jobs_json or "[]").strip() or "[]",
+        jobs_json=get("jobs_json").strip() or "[]",
     )
-    data.jobs = _parse_jobs_json(data.jobs_json)
+    data.jobs, highlights, skills_list, polished_summary = _compute_view(
+        data.wins, data.strengths, data.skills, data.summary, data.years_experience, data.target_title, data.jobs_json
+    )
+    return data, highlights, skills_list, polished_summary
+
 
-    highlights = _make_bullets(data.wins, max_items=7)
-    skills_list = _normalize_skills(data.skills, data.strengths)
-    polished_summary = _generate_resume_summary(data, highlights, skills_list)
+def _result_page(request: Request, fields: Mapping[str, Any]) -> HTMLResponse:
+    data, highlights, skills_list, polished_summary = _materialize(fields)
 
-    return templates.TemplateResponse(
-        "result.html",
+    return _render(
+        PAGE_TEMPLATES["result.html"],
         {
             "request": request,
             "active_tab": "builder",
             "templates": TEMPLATES,
             "selected_template": data.template,
+            "result_template": RESULT_TEMPLATES[data.template],
             "data": data,
             "polished_summary": polished_summary,
             "highlights": highlights,
@@ -692,61 +859,18 @@ def build(
     )
 
 
-@app.get("/swap", response_class=HTMLResponse)
-def swap(
-    request: Request,
-    template: str = "classic",
-
-    full_name: str = "",
-    email: str = "",
-    phone: str = "",
-
-    target_title: str = "",
-    years_experience: str = "",
-    strengths: str = "",
-    wins: str = "",
-    summary: str = "",
-    skills: str = "",
-
-    certs: str = "",
-    awards: str = "",
-    include_references: str = "",
-
-    jobs_json: str = "[]",
-
-    font_family: str = "sans",
-    page_limit: int = 1,
-):
-    data = ResumeData(
-        full_name=_title_name(full_name),
-        email=_clean(email),
-        phone=_clean(phone),
-        template=_clamp_template(template),
-        font_family=_clamp_font(font_family),
-        page_limit=_clamp_page_limit(page_limit),
-
-        target_title=_clean(target_title),
-        years_experience=_clean(years_experience),
-        strengths=_clean(strengths),
-        wins=_clean(wins),
-        summary=_clean(summary),
-        skills=_clean(skills),
-
-        certs=_clean(certs),
-        awards=_clean(awards),
-        include_references=(include_references.strip().lower() == "on") if include_references else False,
+@app.post("/build", response_class=HTMLResponse)
+async def build(request: Request):
+    # only reading the form needs the loop; the view work and render run in the threadpool like /swap
+    return await run_in_threadpool(_result_page, request, await request.form())
 
-        jobs_json=(jobs_json or "[]").strip() or "[]",
-    )
-    data.jobs = _parse_jobs_json(data.jobs_json)
 
-    highlights = _make_bullets(data.wins, max_items=7)
-    skills_list = _normalize_skills(data.skills, data.strengths)
-    polished_summary = _generate_resume_summary(data, highlights, skills_list)
+@app.get("/swap", response_class=HTMLResponse)
+def swap(request: Request):
+    data, highlights, skills_list, polished_summary = _materialize(request.query_params)
 
-    tpl = f"result_{data.template}.html"
-    return templates.TemplateResponse(
-        tpl,
+    return _render(
+        RESULT_TEMPLATES[data.template],
         {
             "request": request,
             "data": data,
@@ -759,59 +883,22 @@ def swap(
 
 
 @app.post("/download_pdf")
-def download_pdf(
-    full_name: str = Form(""),
-    email: str = Form(""),
-    phone: str = Form(""),
-    template: str = Form("classic"),
-    font_family: str = Form("sans"),
-    page_limit: int = Form(1),
-
-    target_title: str = Form(""),
-    years_experience: str = Form(""),
-    strengths: str = Form(""),
-    wins: str = Form(""),
-    summary: str = Form(""),
-    skills: str = Form(""),
-
-    certs: str = Form(""),
-    awards: str = Form(""),
-    include_references: str = Form(""),
-
-    jobs_json: str = Form("[]"),
-):
-    data = ResumeData(
-        full_name=_title_name(full_name),
-        email=_clean(email),
-        phone=_clean(phone),
-        template=_clamp_template(template),
-        font_family=_clamp_font(font_family),
-        page_limit=_clamp_page_limit(page_limit),
-
-        target_title=_clean(target_title),
-        years_experience=_clean(years_experience),
-        strengths=_clean(strengths),
-        wins=_clean(wins),
-        summary=_clean(summary),
-        skills=_clean(skills),
-
-        certs=_clean(certs),
-        awards=_clean(awards),
-        include_references=(include_references.strip().lower() == "on") if include_references else False,
-
-        jobs_json=(jobs_json or "[]").strip() or "[]",
-    )
-    data.jobs = _parse_jobs_json(data.jobs_json)
-
-    highlights = _make_bullets(data.wins, max_items=7)
-    skills_list = _normalize_skills(data.skills, data.strengths)
-    polished_summary = _generate_resume_summary(data, highlights, skills_list)
-
-    pdf_bytes = _build_resume_pdf_bytes(data, polished_summary, highlights, skills_list)
+async def download_pdf(request: Request):
+    data, highlights, skills_list, polished_summary = await run_in_threadpool(_materialize, await request.form())
+
+    key = hashlib.blake2b(repr(astuple(data)).encode(), digest_size=16).digest()
+    pdf_bytes = PDF_CACHE.get(key)
+    if pdf_bytes is None:
+        pdf_bytes = await _run_pdf(_build_resume_pdf_bytes, data, polished_summary, highlights, skills_list)
+        PDF_CACHE[key] = pdf_bytes
+        if len(PDF_CACHE) > PDF_CACHE_SIZE:
+            PDF_CACHE.popitem(last=False)
+    else:
+        PDF_CACHE.move_to_end(key)
     filename = f"{(data.full_name or 'resume').replace(' ', '_')}.pdf"
 
-    return StreamingResponse(
-        io.BytesIO(pdf_bytes),
+    return Response(
+        pdf_bytes,
         media_type="application/pdf",
         headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
@@ -879,8 +966,8 @@ def cover_build(
             "closing_note": data.closing_note,
         }).get("cover_letter_suggested", "")
 
-    return templates.TemplateResponse(
-        "cover_result.html",
+    return _render(
+        PAGE_TEMPLATES["cover_result.html"],
         {
             "request": request,
             "active_tab": "cover",
@@ -891,7 +978,7 @@ def cover_build(
 
 
 @app.post("/cover/download_pdf")
-def cover_download_pdf(
+async def cover_download_pdf(
     full_name: str = Form(""),
     email: str = Form(""),
     phone: str = Form(""),
@@ -946,11 +1033,11 @@ def cover_download_pdf(
             "closing_note": data.closing_note,
         }).get("cover_letter_suggested", "")
 
-    pdf_bytes = _build_cover_pdf_bytes(data, letter_text)
+    pdf_bytes = await _run_pdf(_build_cover_pdf_bytes, data, letter_text)
     filename = f"{(data.full_name or 'cover_letter').replace(' ', '_')}_cover_letter.pdf"
 
-    return StreamingResponse(
-        io.BytesIO(pdf_bytes),
+    return Response(
+        pdf_bytes,
         media_type="application/pdf",
         headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
@@ -961,16 +1048,15 @@ def health():
     return {"ok": True}
 
 
+if __name__ == "__main__":
+    import uvicorn
 
-
-
-
-
-
-
-
-    
-
-
-
-
+    uvicorn.run(
+        "app:app",
+        host="0.0.0.0",
+        port=int(os.environ.get("PORT", "8000")),
+        workers=int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1)),
+        loop="uvloop",
+        http="httptools",
+        log_level="warning",
+    )